@@ -19,6 +19,7 @@ The LocalModelTrainer uses a local thread to launch and manage each training job
 from concurrent.futures.thread import _threads_queues
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Type, Union
+import multiprocessing.forkserver
 import os
 import re
 import threading
@@ -34,12 +35,16 @@ from ..data_model import TrainingStatus
 from ..exceptions import error_handler
 from ..modules import ModuleBase
 from ..toolkit.logging import configure as configure_logging
+from ..toolkit.logging import debug_context
 from .model_trainer_base import ModelTrainerBase, TrainingInfo
 from caikit.core.exceptions.caikit_core_exception import (
     CaikitCoreException,
     CaikitCoreStatusCode,
 )
-from caikit.core.toolkit.concurrency.destroyable_process import DestroyableProcess
+from caikit.core.toolkit.concurrency.destroyable_process import (
+    FORKSERVER_CTX,
+    DestroyableProcess,
+)
 from caikit.core.toolkit.concurrency.destroyable_thread import DestroyableThread
 import caikit
 
@@ -79,6 +84,7 @@ class LocalModelTrainer(ModelTrainerBase):
             subprocess_start_method: str,
             args: Iterable[Any],
             kwargs: Dict[str, Any],
+            concurrency_semaphore: Optional[threading.Semaphore] = None,
         ):
             super().__init__(
                 trainer_name=trainer_name,
@@ -97,14 +103,22 @@ class LocalModelTrainer(ModelTrainerBase):
 
             # Set up the worker and start it
             self._use_subprocess = use_subprocess
-            self._subprocess_start_method = subprocess_start_method
             if self._use_subprocess:
                 log.debug2("Running training %s as a SUBPROCESS", self.id)
+                # NOTE: The target is a module-level function so that only the
+                #   training inputs (not this future) are pickled when the
+                #   subprocess is spawned
                 self._worker = DestroyableProcess(
-                    start_method=self._subprocess_start_method,
-                    target=self._train_and_save,
+                    start_method=subprocess_start_method,
+                    target=_subprocess_train_and_save,
                     return_result=False,
-                    args=args,
+                    args=(
+                        subprocess_start_method,
+                        self._module_class,
+                        self.id,
+                        self.save_path,
+                        *args,
+                    ),
                     kwargs={
                         **kwargs,
                     },
@@ -124,7 +138,27 @@ class LocalModelTrainer(ModelTrainerBase):
                     *args,
                     **kwargs,
                 )
-            self._worker.start()
+
+            # If the number of concurrent trainings is bounded, the worker is
+            # started by a launcher thread once a slot is available. Until
+            # then, the worker is not alive and the training reports QUEUED.
+            # The launch lock keeps cancel() from racing with the launcher
+            # starting the worker, and the launch done event is what wait()
+            # blocks on so that canceling a queued training unblocks it
+            # without waiting for a slot to free up.
+            self._launcher = None
+            self._launch_lock = threading.Lock()
+            self._launch_done = threading.Event()
+            self._worker_started = False
+            if concurrency_semaphore is None:
+                self._worker.start()
+            else:
+                self._launcher = threading.Thread(
+                    target=self._start_when_ready,
+                    args=(concurrency_semaphore,),
+                    daemon=True,
+                )
+                self._launcher.start()
 
         @property
         def completion_time(self) -> Optional[datetime]:
@@ -166,12 +200,19 @@ class LocalModelTrainer(ModelTrainerBase):
                 log.debug2, "Done canceling training %s in: ", self.id
             ):
                 log.debug3("Destroying worker in %s", self.id)
-                self._worker.destroy()
+                with self._launch_lock:
+                    self._worker.destroy()
+                    if self._launcher is not None and not self._worker_started:
+                        log.debug3("Canceled queued training %s", self.id)
+                        self._launch_done.set()
 
         def wait(self):
             """Block until the job reaches a terminal state"""
             log.debug2("Waiting for %s", self.id)
-            self._worker.join()
+            if self._launcher is not None:
+                self._launch_done.wait()
+            else:
+                self._worker.join()
             log.debug2("Done waiting for %s", self.id)
             self._completion_time = self._completion_time or datetime.now()
 
@@ -213,17 +254,28 @@ class LocalModelTrainer(ModelTrainerBase):
                 submission_time=self._submission_time,
             )
 
+        def _start_when_ready(self, concurrency_semaphore: threading.Semaphore):
+            """Function that will run in the launcher thread to start the worker
+            once the trainer's concurrency limit allows it
+            """
+            try:
+                with concurrency_semaphore:
+                    with self._launch_lock:
+                        if self._worker.destroyed:
+                            log.debug2("Not starting canceled training %s", self.id)
+                            return
+                        log.debug2("Starting queued training %s", self.id)
+                        self._worker.start()
+                        self._worker_started = True
+                    self._worker.join()
+            finally:
+                self._launch_done.set()
+
         def _train_and_save(self, *args, **kwargs):
             """Function that will run in the worker thread"""
-            # If running in a spawned subprocess, reconfigure logging
-            if self._use_subprocess and self._subprocess_start_method != "fork":
-                configure_logging()
-            with alog.ContextTimer(log.debug, "Training %s finished in: ", self.id):
-                trained_model = self._module_class.train(*args, **kwargs)
-            if self.save_path is not None:
-                log.debug("Saving training %s to %s", self.id, self.save_path)
-                with alog.ContextTimer(log.debug, "Training %s saved in: ", self.id):
-                    trained_model.save(self.save_path)
+            trained_model = _train_and_save(
+                self._module_class, self.id, self.save_path, *args, **kwargs
+            )
             self._completion_time = self._completion_time or datetime.now()
             log.debug2("Completion time for %s: %s", self.id, self._completion_time)
             return trained_model
@@ -241,6 +293,21 @@ class LocalModelTrainer(ModelTrainerBase):
         self._use_subprocess = config.get("use_subprocess", False)
         self._subprocess_start_method = config.get("subprocess_start_method", "spawn")
         self._retention_duration = config.get("retention_duration")
+        max_concurrent_trainings = config.get("max_concurrent_trainings")
+        self._concurrency_semaphore = None
+        if max_concurrent_trainings is not None:
+            error.type_check(
+                "<COR71542238E>", int, max_concurrent_trainings=max_concurrent_trainings
+            )
+            error.value_check(
+                "<COR71542239E>",
+                max_concurrent_trainings > 0,
+                "Invalid max_concurrent_trainings: {}",
+                max_concurrent_trainings,
+            )
+            self._concurrency_semaphore = threading.BoundedSemaphore(
+                max_concurrent_trainings
+            )
         if self._retention_duration is not None:
             try:
                 log.debug2("Parsing retention duration: %s", self._retention_duration)
@@ -283,6 +350,10 @@ class LocalModelTrainer(ModelTrainerBase):
         # Always purge old futures
         self._purge_old_futures()
 
+        # Make sure the forkserver will have the module's code imported
+        if self._use_subprocess and self._subprocess_start_method == "forkserver":
+            _add_forkserver_preload("caikit", module_class.__module__)
+
         # Wrap any models in the kwargs for safe spawning if needed
         if self._use_subprocess and self._subprocess_start_method != "fork":
             wrapped_models = {
@@ -317,6 +388,7 @@ class LocalModelTrainer(ModelTrainerBase):
             model_name=model_name,
             args=args,
             kwargs=kwargs,
+            concurrency_semaphore=self._concurrency_semaphore,
         )
 
         # Lock the global futures dict and add it to the dict
@@ -369,6 +441,72 @@ class LocalModelTrainer(ModelTrainerBase):
                 self._futures.pop(fid, None)
 
 
+def _get_forkserver_preload() -> List[str]:
+    """Get the modules currently in the forkserver's preload list"""
+    # NOTE: multiprocessing has no public getter for the preload list, so this
+    #   reads it off of the forkserver. The stdlib default is only assumed if
+    #   the attribute does not exist so that an empty list set on purpose by
+    #   the application is kept.
+    # pylint: disable=protected-access
+    preload_modules = getattr(
+        multiprocessing.forkserver._forkserver, "_preload_modules", None
+    )
+    if preload_modules is None:
+        return ["__main__"]
+    return list(preload_modules)
+
+
+def _add_forkserver_preload(*module_names: str):
+    """Append modules to the forkserver's preload list so that each forkserver
+    training subprocess is forked from a process that already imported them.
+
+    NOTE: The preload list is process-wide and is only read when the forkserver
+        starts, so this only takes effect for modules added before the first
+        forkserver process is launched. The existing entries (__main__ by
+        default, plus anything set by the embedding application) are kept.
+    """
+    preload_modules = _get_forkserver_preload()
+    new_modules = [name for name in module_names if name not in preload_modules]
+    if new_modules:
+        log.debug2("Adding %s to forkserver preload", new_modules)
+        FORKSERVER_CTX.set_forkserver_preload(preload_modules + new_modules)
+
+
+def _train_and_save(
+    module_class: Type[ModuleBase],
+    training_id: str,
+    save_path: Optional[str],
+    /,
+    *args,
+    **kwargs,
+) -> ModuleBase:
+    """Run the training for the given module and save the result if a save
+    path is given
+
+    NOTE: The leading arguments are positional-only so that they cannot
+        collide with the module's own train kwargs
+    """
+    with debug_context(
+        log, alog.ContextTimer, "Training %s finished in: ", training_id
+    ):
+        trained_model = module_class.train(*args, **kwargs)
+    if save_path is not None:
+        log.debug("Saving training %s to %s", training_id, save_path)
+        with debug_context(
+            log, alog.ContextTimer, "Training %s saved in: ", training_id
+        ):
+            trained_model.save(save_path)
+    return trained_model
+
+
+def _subprocess_train_and_save(start_method: str, /, *args, **kwargs):
+    """Function that will run in the worker subprocess"""
+    # If running in a spawned subprocess, reconfigure logging
+    if start_method != "fork":
+        configure_logging()
+    _train_and_save(*args, **kwargs)
+
+
 class _SpawnProcessModelWrapper(ModuleBase):
     """This class wraps up a model to make it safe to pass to a spawned
     subprocess. It will not be efficient, but it will be safe!
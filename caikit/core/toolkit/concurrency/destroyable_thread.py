@@ -201,7 +201,8 @@ class DestroyableThread(threading.Thread, Destroyable):
         self.__destroyed = True
 
         # The thread has already finished or is not yet alive, so we cannot kill it
-        thread_id = self.__get_id()
+        # NOTE: ident is only set once the thread has started
+        thread_id = self.ident
         if thread_id is None or not self.is_alive():
             log.debug(
                 "<COR14653276D>",
@@ -228,15 +229,6 @@ class DestroyableThread(threading.Thread, Destroyable):
         if isinstance(self.__runnable_exception, Exception):
             return self.__runnable_exception
 
-    def __get_id(self):
-        # Returns the thread if if the thread is running
-        for thread in threading.enumerate():
-            if thread is self:
-                return thread.ident
-
-        # Otherwise, the thread has completed or has not started
-        return None
-
     def __raise(self):
         # __exception is just a type, we need to be sure to initialize a value of it
         raise self.__exception()
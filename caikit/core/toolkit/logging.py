@@ -13,6 +13,10 @@
 # limitations under the License.
 """Logging top-level configuration for `caikit.core` library.
 """
+# Standard
+from typing import Type, Union
+import contextlib
+import logging
 
 # First Party
 import alog
@@ -46,3 +50,33 @@ def configure():
         formatter,
         caikit_config.log.thread_id,
     )
+
+
+# Shared no-op context returned by debug_context when debug logging is disabled
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def debug_context(
+    log: logging.Logger,
+    context_class: Type[Union[alog.ContextLog, alog.ContextTimer]],
+    msg: str,
+    *args,
+):
+    """Create an alog context (e.g. alog.ContextLog or alog.ContextTimer) that
+    logs to the given channel at debug level. If debug logging is disabled for
+    the channel, a no-op context is returned instead so that the context
+    object is never created.
+
+    Args:
+        log (logging.Logger): The log channel to log to
+        context_class (Type[Union[alog.ContextLog, alog.ContextTimer]]): The
+            alog context class to create
+        msg (str): The log message format string
+        *args: The arguments for the format string
+
+    Returns:
+        context: The alog context or a no-op context
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        return context_class(log.debug, msg, *args)
+    return _NULL_CONTEXT
@@ -19,6 +19,9 @@ and other Protobuf names
 # Standard
 import re
 
+# Zero-width match at every upper-case letter that is not at the start
+_CAMEL_SPLIT_EXPR = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 def snake_to_upper_camel(string: str) -> str:
     """Simple snake -> upper camel conversion for descriptors"""
@@ -27,8 +30,4 @@ def snake_to_upper_camel(string: str) -> str:
 
 def camel_to_snake_case(string: str, kebab_case: bool = False) -> str:
     """Convert from CamelCase (or camelCase) to snake_case or kebab-case"""
-    return re.sub(
-        r"(?<!^)(?=[A-Z])",
-        "-" if kebab_case else "_",
-        string,
-    ).lower()
+    return _CAMEL_SPLIT_EXPR.sub("-" if kebab_case else "_", string).lower()
@@ -14,7 +14,7 @@
 """This module is responsible for creating service objects for the runtime to consume"""
 # Standard
 from types import ModuleType
-from typing import Callable, Dict, Set, Type, Union
+from typing import Callable, Dict, Set, Tuple, Type, Union
 import dataclasses
 import json
 import os
@@ -71,6 +71,7 @@ class ServicePackage:
     - A grpc servicer registration function
     - A client stub
     - A client messages module
+    - (training only) A mapping from request message descriptor to module class
     """
 
     service: Type[google.protobuf.service.Service]
@@ -81,6 +82,9 @@ class ServicePackage:
     stub_class: Type
     messages: ModuleType
     caikit_rpcs: Dict[str, CaikitRPCBase]
+    request_descriptor_to_module: Dict[
+        google.protobuf.descriptor.Descriptor, Type[ModuleBase]
+    ] = dataclasses.field(default_factory=dict)
 
 
 class ServicePackageFactory:
@@ -88,6 +92,34 @@ class ServicePackageFactory:
 
     ServiceType = InterfaceServiceType
 
+    # Service packages built by get_service_package_cached, keyed by service
+    # type and holding the config object they were generated with
+    _SERVICE_PACKAGE_CACHE: Dict[
+        ServiceType, Tuple[aconfig.Config, ServicePackage]
+    ] = {}
+
+    @classmethod
+    def get_service_package_cached(cls, service_type: ServiceType) -> ServicePackage:
+        """Get a service package of the requested type, reusing the one built by a
+        previous call if the caikit config has not changed since.
+
+        Args:
+            service_type (ServicePackageFactory.ServiceType): The type of service to build
+
+        Returns:
+            ServicePackage: The (possibly cached) service package
+        """
+        caikit_config = get_config()
+        cached = cls._SERVICE_PACKAGE_CACHE.get(service_type)
+        # NOTE: Every call to configure() replaces the global config object, so
+        #   comparing by identity is enough to detect a changed library or
+        #   service generation setup
+        if cached is not None and cached[0] is caikit_config:
+            return cached[1]
+        service_package = cls.get_service_package(service_type)
+        cls._SERVICE_PACKAGE_CACHE[service_type] = (caikit_config, service_package)
+        return service_package
+
     @classmethod
     def get_service_package(
         cls, service_type: ServiceType, write_modules_file: bool = False
@@ -183,8 +215,14 @@ class ServicePackageFactory:
 
         rpc_list = [rpc for rpc in rpc_list if rpc.return_type is not None]
 
+        request_descriptor_to_module = {}
         for rpc in rpc_list:
-            rpc.create_request_data_model(package_name)
+            request_data_model = rpc.create_request_data_model(package_name)
+            if service_type == cls.ServiceType.TRAINING:
+                # Each train rpc is for exactly one module
+                request_descriptor_to_module[
+                    request_data_model.get_proto_class().DESCRIPTOR
+                ] = rpc.clz
 
         client_module = ModuleType(
             "ClientMessages",
@@ -208,6 +246,7 @@ class ServicePackageFactory:
             stub_class=grpc_service.client_stub_class,
             messages=client_module,
             caikit_rpcs={rpc.name: rpc for rpc in rpc_list},
+            request_descriptor_to_module=request_descriptor_to_module,
         )
 
     # Implementation details for pure python service packages #
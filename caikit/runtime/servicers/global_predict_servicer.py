@@ -13,7 +13,6 @@
 # limitations under the License.
 # Standard
 from contextlib import contextmanager
-from importlib.metadata import version
 from typing import Any, Dict, Iterable, Optional, Set, Union
 import itertools
 import traceback
@@ -39,7 +38,7 @@ from caikit.runtime.names import MODEL_MESH_MODEL_ID_KEY
 from caikit.runtime.service_factory import ServicePackage
 from caikit.runtime.service_generation.rpcs import TaskPredictRPC
 from caikit.runtime.types.caikit_runtime_exception import CaikitRuntimeException
-from caikit.runtime.utils.import_util import clean_lib_names
+from caikit.runtime.utils.import_util import clean_lib_names, get_library_version
 from caikit.runtime.utils.servicer_util import (
     build_caikit_library_request_dict,
     build_proto_response,
@@ -123,10 +122,7 @@ class GlobalPredictServicer:
         # Duplicate code in global_train_servicer
         # pylint: disable=duplicate-code
         library = clean_lib_names(get_config().runtime.library)[0]
-        try:
-            lib_version = version(library)
-        except Exception:  # pylint: disable=broad-exception-caught
-            lib_version = "unknown"
+        lib_version = get_library_version(library)
 
         log.info(
             "<RUN76884779I>",
@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # Standard
-from importlib.metadata import version
-from typing import Optional, Type, Union
+from typing import Dict, Optional, Type, Union
 import traceback
 
 # Third Party
@@ -27,28 +26,54 @@ import alog
 # Local
 from caikit import get_config
 from caikit.core import MODEL_MANAGER, ModuleBase
+from caikit.core.data_model import DataBase
 from caikit.core.exceptions.caikit_core_exception import CaikitCoreException
+from caikit.core.model_management import ModelTrainerBase
+from caikit.core.registries import module_registry
+from caikit.core.toolkit.logging import debug_context
 from caikit.interfaces.common.data_model.stream_sources import S3Path
 from caikit.interfaces.runtime.data_model import TrainingJob
 from caikit.runtime.model_management.model_manager import ModelManager
 from caikit.runtime.service_factory import ServicePackage
 from caikit.runtime.service_generation.rpcs import ModuleClassTrainRPC
 from caikit.runtime.types.caikit_runtime_exception import CaikitRuntimeException
-from caikit.runtime.utils.import_util import clean_lib_names, get_data_model
+from caikit.runtime.utils.import_util import (
+    clean_lib_names,
+    get_data_model,
+    get_library_version,
+)
 from caikit.runtime.utils.servicer_util import (
     build_caikit_library_request_dict,
     raise_caikit_runtime_exception,
     validate_data_model,
 )
-import caikit.core
 
 log = alog.use_channel("GT-SERVICR-I")
-error = caikit.core.exceptions.error_handler.get(log)
 
 # Protobuf non primitives
 # Ref: https://developers.google.com/protocol-buffers/docs/reference/cpp/google.protobuf.descriptor
 NON_PRIMITIVE_TYPES = [FieldDescriptor.TYPE_MESSAGE, FieldDescriptor.TYPE_ENUM]
 
+
+class _RpcTerminationCallback:
+    """Callback registered on a training rpc's context that cancels the model
+    future if the rpc terminates before the training has completed
+    """
+
+    __slots__ = ("_model_future",)
+
+    def __init__(self, model_future: ModelTrainerBase.ModelFutureBase):
+        self._model_future = model_future
+
+    def __call__(self):
+        """Cancel the model future if it has not yet completed"""
+        if not self._model_future.get_info().status.is_terminal:
+            log.warning(
+                "<RUN36361257W>", "Canceling training %s", self._model_future.id
+            )
+            self._model_future.cancel()
+
+
 # pylint: disable=too-many-instance-attributes
 class GlobalTrainServicer:
     """Something something about the train servicer"""
@@ -69,10 +94,7 @@ class GlobalTrainServicer:
         # Duplicate code in global_train_servicer
         # pylint: disable=duplicate-code
         self.library = clean_lib_names(get_config().runtime.library)[0]
-        try:
-            lib_version = version(self.library)
-        except Exception:  # pylint: disable=broad-exception-caught
-            lib_version = "unknown"
+        lib_version = get_library_version(self.library)
 
         log.info(
             "<RUN76884778I>",
@@ -80,6 +102,12 @@ class GlobalTrainServicer:
             self.library,
             lib_version,
         )
+
+        # Cache of train request message name -> module class so that Train
+        # does not need to scan the module registry on every request
+        self._module_by_req_name: Dict[str, Type[ModuleBase]] = {}
+        self._scanned_registry_size = 0
+        self._refresh_module_by_req_name()
         super()
 
     @property
@@ -112,16 +140,13 @@ class GlobalTrainServicer:
         outer_scope_name = f"GlobalTrainServicer.Train:{desc_name}"
 
         try:
-            with alog.ContextLog(log.debug, outer_scope_name):
-                module = None
-                for mod in caikit.core.registries.module_registry().values():
-                    if mod.tasks:
-                        train_request_for_mod = (
-                            ModuleClassTrainRPC.module_class_to_req_name(mod)
-                        )
-                        if train_request_for_mod == desc_name:
-                            module = mod
-                            break
+            with debug_context(log, alog.ContextLog, outer_scope_name):
+                # Look the module up by the identity of the request's descriptor
+                # first and only fall back to matching on the request name for
+                # requests that were not generated with the training service
+                module = self._training_service.request_descriptor_to_module.get(
+                    request.DESCRIPTOR
+                ) or self._get_train_module(desc_name)
 
                 # At this point, if model is still None, we don't know the module this request
                 # is for
@@ -130,13 +155,20 @@ class GlobalTrainServicer:
                         StatusCode.INTERNAL,
                         "Global Train not able to parse module for this Train Request",
                     )
-                return self.run_training_job(
+                training_job = self.run_training_job(
                     request=request,
                     module=module,
                     training_output_dir=self.training_output_dir,
                     wait=False,
                     context=context,
-                ).to_proto()
+                )
+
+                # Build the response message directly rather than going through
+                # the generic data model to_proto conversion
+                return TrainingJob.get_proto_class()(
+                    model_name=training_job.model_name,
+                    training_id=training_job.training_id,
+                )
 
         except CaikitRuntimeException as e:
             log_dict = {
@@ -214,9 +246,7 @@ class GlobalTrainServicer:
             training_job (TrainingJob): The job handle for the training with the
                 job's ID and the model's name
         """
-        request_data_model = caikit.core.data_model.DataBase.get_class_for_proto(
-            request
-        ).from_proto(request)
+        request_data_model = DataBase.get_class_for_proto(request).from_proto(request)
 
         # Figure out where this model will be saved
         model_path: Union[str, S3Path]
@@ -259,19 +289,12 @@ class GlobalTrainServicer:
             # Register the cancellation callback if given a context
             if context is not None:
 
-                # Create a callback to register termination of training
-                def rpc_termination_callback():
-                    """Cancel the model future if it has not yet completed"""
-                    if not model_future.get_info().status.is_terminal:
-                        log.warning(
-                            "<RUN36361257W>", "Canceling training %s", model_future.id
-                        )
-                        model_future.cancel()
-
                 # NOTE: callback registration needs to be before waiting for the
                 #   future, otherwise request will wait before registering
                 #   callback.
-                callback_registered = context.add_callback(rpc_termination_callback)
+                callback_registered = context.add_callback(
+                    _RpcTerminationCallback(model_future)
+                )
                 if not callback_registered:
                     log.warning(
                         "<RUN54118242W>",
@@ -282,8 +305,8 @@ class GlobalTrainServicer:
                         "Could not register RPC callback, call has likely terminated.",
                     )
 
-            with alog.ContextTimer(
-                log.debug, "Training %s complete in: ", model_future.id
+            with debug_context(
+                log, alog.ContextTimer, "Training %s complete in: ", model_future.id
             ):
                 model_future.wait()
                 training_info = model_future.get_info()
@@ -301,3 +324,30 @@ class GlobalTrainServicer:
             model_name=request.model_name,
             training_id=model_future.id,
         )
+
+    ## Implementation Details ##################################################
+
+    def _get_train_module(self, req_name: str) -> Optional[Type[ModuleBase]]:
+        """Look up the module class for the given train request name. If not
+        found and modules have been registered since the registry was last
+        scanned, rescan it.
+        """
+        module = self._module_by_req_name.get(req_name)
+        if module is None and len(module_registry()) != self._scanned_registry_size:
+            self._refresh_module_by_req_name()
+            module = self._module_by_req_name.get(req_name)
+        return module
+
+    def _refresh_module_by_req_name(self):
+        """Populate the cache of train request names to module classes from
+        the global module registry
+        """
+        registry = module_registry()
+        module_by_req_name = {}
+        for mod in registry.values():
+            if mod.tasks:
+                module_by_req_name.setdefault(
+                    ModuleClassTrainRPC.module_class_to_req_name(mod), mod
+                )
+        self._module_by_req_name = module_by_req_name
+        self._scanned_registry_size = len(registry)
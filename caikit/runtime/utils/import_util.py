@@ -15,8 +15,10 @@
 """
 
 # Standard
+from importlib.metadata import version
 from types import ModuleType
 from typing import Any, List
+import functools
 import importlib
 import re
 import sys
@@ -181,6 +183,24 @@ def get_dynamic_module(module_name: str, module_dir: str = None) -> ModuleType:
     return importlib.import_module(module_path, "*")
 
 
+@functools.lru_cache(maxsize=None)
+def get_library_version(library: str) -> str:
+    """Get the installed version of the given library. The result is cached
+    since looking up package metadata searches the filesystem.
+
+    Args:
+        library (str): The name of the library distribution
+
+    Returns:
+        version (str): The library's version or "unknown" if it cannot be
+            determined
+    """
+    try:
+        return version(library)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return "unknown"
+
+
 def clean_lib_names(caikit_library: str) -> List[str]:
     def clean(lib):
         # Regex explanation:
@@ -15,12 +15,12 @@
 """
 # Standard
 from functools import update_wrapper
-from typing import Any, Dict, Iterable, Iterator, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 import sys
 import traceback
 
 # Third Party
-from google.protobuf.descriptor import FieldDescriptor, ServiceDescriptor
+from google.protobuf.descriptor import Descriptor, FieldDescriptor, ServiceDescriptor
 from google.protobuf.message import Message as ProtoMessageType
 import grpc
 
@@ -50,6 +50,10 @@ log = alog.use_channel("SERVICR-UTIL")
 # Ref: https://developers.google.com/protocol-buffers/docs/reference/cpp/google.protobuf.descriptor
 NON_PRIMITIVE_TYPES = [FieldDescriptor.TYPE_MESSAGE, FieldDescriptor.TYPE_ENUM]
 
+# Cache of message descriptor -> names of the fields that do and do not support
+# presence checks with HasField
+_FIELD_PRESENCE_CACHE: Dict[Descriptor, Tuple[List[str], List[str]]] = {}
+
 
 def validate_caikit_library_class_exists(cdm, class_name):
     try:
@@ -389,22 +393,18 @@ def build_caikit_library_request_dict(
         kwargs_dict = request_data_model.to_kwargs()
 
         # 1. Remove any fields not in request
-        unset_field_names = []
-        for field in request.DESCRIPTOR.fields:
-            try:
-                if not request.HasField(field.name):
-                    unset_field_names.append(field.name)
-            except ValueError as e:
-                log.debug2(
-                    "failed to check HasField on field %s, error: %s",
-                    field.name,
-                    e,
-                )
-                # Remove empty iterables since we cannot distinguish between
-                # unset and empty repeated fields
-                field_value = getattr(request, field.name)
-                if isinstance(field_value, Iterable) and len(field_value) == 0:
-                    unset_field_names.append(field.name)
+        presence_field_names, no_presence_field_names = _get_field_presence(request)
+        unset_field_names = [
+            field_name
+            for field_name in presence_field_names
+            if not request.HasField(field_name)
+        ]
+        for field_name in no_presence_field_names:
+            # Remove empty iterables since we cannot distinguish between
+            # unset and empty repeated fields
+            field_value = getattr(request, field_name)
+            if isinstance(field_value, Iterable) and len(field_value) == 0:
+                unset_field_names.append(field_name)
         for unset_field_name in unset_field_names:
             if unset_field_name in kwargs_dict:
                 kwargs_dict.pop(unset_field_name)
@@ -460,6 +460,39 @@ def build_caikit_library_request_dict(
         ) from e
 
 
+def _get_field_presence(request: ProtoMessageType) -> Tuple[List[str], List[str]]:
+    """Get the names of the fields in the request's message type that do and do
+    not support HasField. The result is cached by message descriptor since it
+    only depends on the message type.
+
+    Args:
+        request (ProtoMessageType):
+            The request proto message to inspect
+
+    Returns:
+        presence_field_names (List[str]): Fields that support HasField
+        no_presence_field_names (List[str]): Fields that do not support HasField
+    """
+    field_presence = _FIELD_PRESENCE_CACHE.get(request.DESCRIPTOR)
+    if field_presence is None:
+        presence_field_names = []
+        no_presence_field_names = []
+        for field in request.DESCRIPTOR.fields:
+            try:
+                request.HasField(field.name)
+                presence_field_names.append(field.name)
+            except ValueError as e:
+                log.debug2(
+                    "failed to check HasField on field %s, error: %s",
+                    field.name,
+                    e,
+                )
+                no_presence_field_names.append(field.name)
+        field_presence = (presence_field_names, no_presence_field_names)
+        _FIELD_PRESENCE_CACHE[request.DESCRIPTOR] = field_presence
+    return field_presence
+
+
 def raise_caikit_runtime_exception(exception: CaikitCoreException):
     if exception.status_code == CaikitCoreStatusCode.NOT_FOUND:
         log.debug2("Not Found Error: [%s]", exception.message, exc_info=True)
@@ -38,11 +38,12 @@ if __name__ == "__main__":
         }
     )
 
-    inference_service = ServicePackageFactory().get_service_package(
+    inference_service = ServicePackageFactory.get_service_package_cached(
         ServicePackageFactory.ServiceType.INFERENCE,
     )
 
     model_id = "text_sentiment"
+    texts = ["I am not feeling well today!", "Today is a nice sunny day"]
 
     if get_config().runtime.grpc.enabled:
         # Setup the client
@@ -50,26 +51,38 @@ if __name__ == "__main__":
         channel = grpc.insecure_channel(f"localhost:{port}")
         client_stub = inference_service.stub_class(channel)
 
-        # Run inference for two sample prompts
-        for text in ["I am not feeling well today!", "Today is a nice sunny day"]:
-            request = get_inference_request(HuggingFaceSentimentTask)(
-                text_input=text
-            ).to_proto()
-            response = client_stub.HuggingFaceSentimentTaskPredict(
-                request, metadata=[("mm-model-id", model_id)], timeout=1
+        # Make sure the channel is connected before sending requests so that
+        # the first request does not pay for the connection setup
+        grpc.channel_ready_future(channel).result(timeout=5)
+
+        # Run inference for the sample prompts. The task only has a unary RPC,
+        # so send all of the requests before waiting on any of the responses
+        # so that they are processed concurrently over the same channel.
+        response_futures = [
+            client_stub.HuggingFaceSentimentTaskPredict.future(
+                get_inference_request(HuggingFaceSentimentTask)(
+                    text_input=text
+                ).to_proto(),
+                metadata=[("mm-model-id", model_id)],
+                timeout=1,
             )
+            for text in texts
+        ]
+        for text, response_future in zip(texts, response_futures):
             print("Text:", text)
-            print("RESPONSE from gRPC:", response)
+            print("RESPONSE from gRPC:", response_future.result())
 
     if get_config().runtime.http.enabled:
         port = 8080
-        # Run inference for two sample prompts
-        for text in ["I am not feeling well today!", "Today is a nice sunny day"]:
-            payload = {"inputs": text, "model_id": model_id}
-            response = requests.post(
-                f"http://localhost:{port}/api/v1/task/hugging-face-sentiment",
-                json=payload,
-                timeout=1,
-            )
-            print("\nText:", text)
-            print("RESPONSE from HTTP:", json.dumps(response.json(), indent=4))
+        # Use a single session so that the connection is reused across requests
+        with requests.Session() as session:
+            # Run inference for the sample prompts
+            for text in texts:
+                payload = {"inputs": text, "model_id": model_id}
+                response = session.post(
+                    f"http://localhost:{port}/api/v1/task/hugging-face-sentiment",
+                    json=payload,
+                    timeout=1,
+                )
+                print("\nText:", text)
+                print("RESPONSE from HTTP:", json.dumps(response.json(), indent=4))
@@ -16,10 +16,13 @@ Tests for LocalModelTrainer
 """
 # Standard
 from datetime import timedelta
+from unittest.mock import patch
 import multiprocessing
+import multiprocessing.forkserver
 import os
 import tempfile
 import threading
+import time
 
 # Third Party
 import pytest
@@ -32,6 +35,7 @@ from caikit.config import get_config
 from caikit.core import ModuleBase
 from caikit.core.data_model import DataStream, TrainingStatus
 from caikit.core.exceptions.caikit_core_exception import CaikitCoreException
+from caikit.core.model_management import local_model_trainer
 from caikit.core.model_management.local_model_trainer import LocalModelTrainer
 from sample_lib.modules import SampleModule
 
@@ -325,3 +329,120 @@ def test_duplicate_external_id_cannot_restart_while_running():
     finally:
         wait_event.set()
         model_future.wait()
+
+
+def test_max_concurrent_trainings(trainer_type_cfg):
+    """Make sure that trainings beyond the concurrency limit are queued until a
+    running training completes
+    """
+    trainer = local_trainer(max_concurrent_trainings=1, **trainer_type_cfg)
+    wait_event = get_event(trainer_type_cfg)
+    running_future = trainer.train(
+        SampleModule,
+        DataStream.from_iterable([]),
+        wait_event=wait_event,
+    )
+    queued_future = trainer.train(
+        SampleModule,
+        DataStream.from_iterable([]),
+        wait_event=wait_event,
+    )
+    try:
+        # Give the first training a chance to claim the only slot
+        for _ in range(100):
+            if running_future.get_info().status == TrainingStatus.RUNNING:
+                break
+            time.sleep(0.01)
+        assert running_future.get_info().status == TrainingStatus.RUNNING
+        assert queued_future.get_info().status == TrainingStatus.QUEUED
+    finally:
+        wait_event.set()
+        running_future.wait()
+        queued_future.wait()
+    assert running_future.get_info().status == TrainingStatus.COMPLETED
+    assert queued_future.get_info().status == TrainingStatus.COMPLETED
+
+
+def test_max_concurrent_trainings_cancel_queued():
+    """Make sure that a queued training can be canceled before it starts"""
+    trainer = local_trainer(max_concurrent_trainings=1)
+    wait_event = threading.Event()
+    running_future = trainer.train(WaitTrain, wait_event)
+    queued_future = trainer.train(WaitTrain, wait_event)
+    queued_future.cancel()
+    assert queued_future.get_info().status == TrainingStatus.CANCELED
+
+    # Waiting on the canceled training returns while the running training
+    # still holds the only slot
+    waiter = threading.Thread(target=queued_future.wait, daemon=True)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert queued_future.get_info().status == TrainingStatus.CANCELED
+    assert running_future.get_info().status == TrainingStatus.RUNNING
+
+    wait_event.set()
+    running_future.wait()
+    assert running_future.get_info().status == TrainingStatus.COMPLETED
+
+
+@pytest.mark.parametrize("max_concurrent_trainings", [0, -1, "1"])
+def test_max_concurrent_trainings_invalid(max_concurrent_trainings):
+    """Make sure that invalid concurrency limits are rejected"""
+    with pytest.raises((TypeError, ValueError)):
+        local_trainer(max_concurrent_trainings=max_concurrent_trainings)
+
+
+def test_forkserver_preloads_module(save_path):
+    """Make sure that training with the forkserver start method adds the
+    module to the forkserver's preload list and trains successfully.
+
+    NOTE: This only covers the contents of the preload list. If an earlier
+        test already started the forkserver, the preload does not take effect
+        in this process and this test can't tell.
+    """
+    # Restore the process-wide preload list when done
+    with patch.object(
+        multiprocessing.forkserver._forkserver,
+        "_preload_modules",
+        local_model_trainer._get_forkserver_preload(),
+    ):
+        trainer = local_trainer(
+            use_subprocess=True, subprocess_start_method="forkserver"
+        )
+        model_future = trainer.train(
+            SampleModule,
+            DataStream.from_iterable([]),
+            save_path=save_path,
+        )
+        model_future.wait()
+        assert model_future.get_info().status == TrainingStatus.COMPLETED
+        assert {"caikit", SampleModule.__module__}.issubset(
+            multiprocessing.forkserver._forkserver._preload_modules
+        )
+
+
+def test_add_forkserver_preload_keeps_existing_modules():
+    """Make sure that adding to the forkserver preload list keeps __main__ and
+    anything the application already set, without duplicating entries
+    """
+    with patch.object(
+        multiprocessing.forkserver._forkserver,
+        "_preload_modules",
+        ["__main__", "app_module"],
+    ):
+        local_model_trainer._add_forkserver_preload("caikit", "app_module")
+        assert multiprocessing.forkserver._forkserver._preload_modules == [
+            "__main__",
+            "app_module",
+            "caikit",
+        ]
+
+
+def test_add_forkserver_preload_keeps_empty_preload_list():
+    """Make sure that an empty preload list set by the application is not
+    replaced with the __main__ default
+    """
+    with patch.object(multiprocessing.forkserver._forkserver, "_preload_modules", []):
+        local_model_trainer._add_forkserver_preload("caikit")
+        assert multiprocessing.forkserver._forkserver._preload_modules == ["caikit"]
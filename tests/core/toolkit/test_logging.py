@@ -0,0 +1,41 @@
+# Copyright The Caikit Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard
+from unittest.mock import patch
+
+# Third Party
+import pytest
+
+# First Party
+import alog
+
+# Local
+from caikit.core.toolkit.logging import _NULL_CONTEXT, debug_context
+
+log = alog.use_channel("TEST-LOG")
+
+
+@pytest.mark.parametrize("context_class", [alog.ContextLog, alog.ContextTimer])
+def test_debug_context_only_created_when_debug_enabled(context_class):
+    """Make sure that debug_context only creates the alog context when debug
+    logging is enabled for the channel
+    """
+    with patch.object(log, "isEnabledFor", return_value=False):
+        assert debug_context(log, context_class, "msg %s", "arg") is _NULL_CONTEXT
+    with patch.object(log, "isEnabledFor", return_value=True):
+        context = debug_context(log, context_class, "msg %s", "arg")
+        assert isinstance(context, context_class)
+        with context:
+            pass
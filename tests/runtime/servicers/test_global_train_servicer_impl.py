@@ -28,6 +28,7 @@ import pytest
 from caikit.config import get_config
 from caikit.core import MODEL_MANAGER
 from caikit.core.data_model.producer import ProducerId
+from caikit.core.registries import module_registry
 from caikit.interfaces.common.data_model.stream_sources import S3Path
 from caikit.runtime.service_factory import (
     get_inference_request,
@@ -195,6 +196,98 @@ def test_global_train_other_task(
     )
 
 
+def test_global_train_finds_module_missing_from_cache(sample_train_servicer):
+    """Global train falls back to the module registry for train requests whose
+    module was not known when the servicer was constructed
+    """
+    stream_type = caikit.interfaces.common.data_model.DataStreamSourceInt
+    training_data = stream_type(jsondata=stream_type.JsonData(data=[1]))
+    train_request = get_train_request(OtherModule)(
+        model_name="Other module Training",
+        parameters=get_train_params(OtherModule)(
+            training_data=training_data,
+            sample_input_sampleinputtype=HAPPY_PATH_INPUT_DM,
+        ),
+    ).to_proto()
+
+    with patch.object(
+        sample_train_servicer._training_service, "request_descriptor_to_module", {}
+    ), patch.object(
+        sample_train_servicer, "_module_by_req_name", {}
+    ), patch.object(
+        sample_train_servicer, "_scanned_registry_size", 0
+    ):
+        training_response = sample_train_servicer.Train(
+            train_request, Fixtures.build_context("foo")
+        )
+        assert (
+            sample_train_servicer._module_by_req_name[train_request.DESCRIPTOR.name]
+            is OtherModule
+        )
+    assert training_response.model_name == "Other module Training"
+    MODEL_MANAGER.get_model_future(training_response.training_id).wait()
+
+
+def test_global_train_looks_up_module_by_request_descriptor(
+    sample_train_service, sample_train_servicer
+):
+    """Global train finds the module for a train request by its descriptor
+    without falling back to the request name
+    """
+    train_request_class = get_train_request(OtherModule)
+    assert (
+        sample_train_service.request_descriptor_to_module[
+            train_request_class.get_proto_class().DESCRIPTOR
+        ]
+        is OtherModule
+    )
+
+    stream_type = caikit.interfaces.common.data_model.DataStreamSourceInt
+    training_data = stream_type(jsondata=stream_type.JsonData(data=[1]))
+    train_request = train_request_class(
+        model_name="Other module Training",
+        parameters=get_train_params(OtherModule)(
+            training_data=training_data,
+            sample_input_sampleinputtype=HAPPY_PATH_INPUT_DM,
+        ),
+    ).to_proto()
+
+    with patch.object(
+        sample_train_servicer, "_get_train_module"
+    ) as get_train_module_mock:
+        training_response = sample_train_servicer.Train(
+            train_request, Fixtures.build_context("foo")
+        )
+        get_train_module_mock.assert_not_called()
+    assert training_response.model_name == "Other module Training"
+    MODEL_MANAGER.get_model_future(training_response.training_id).wait()
+
+
+def test_global_train_unknown_request_does_not_rescan_unchanged_registry(
+    sample_train_servicer,
+):
+    """Global train does not rescan the module registry for an unknown train
+    request when no modules have been registered since the last scan
+    """
+    train_request = get_train_request(OtherModule)(
+        model_name="Other module Training"
+    ).to_proto()
+
+    with patch.object(
+        sample_train_servicer._training_service, "request_descriptor_to_module", {}
+    ), patch.object(
+        sample_train_servicer, "_module_by_req_name", {}
+    ), patch.object(
+        sample_train_servicer, "_scanned_registry_size", len(module_registry())
+    ), patch.object(
+        sample_train_servicer, "_refresh_module_by_req_name"
+    ) as refresh_mock:
+        with pytest.raises(CaikitRuntimeException) as context:
+            sample_train_servicer.Train(train_request, Fixtures.build_context("foo"))
+        assert context.value.status_code == grpc.StatusCode.INTERNAL
+        refresh_mock.assert_not_called()
+
+
 def test_global_train_Another_Widget_that_requires_SampleWidget_loaded_should_not_raise(
     sample_task_model_id,
     sample_train_service,
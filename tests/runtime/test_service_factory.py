@@ -15,6 +15,7 @@
 """Unit tests for the service factory"""
 # Standard
 from pathlib import Path
+from unittest import mock
 import json
 import os
 import tempfile
@@ -252,6 +253,29 @@ def test_assert_compatible_does_not_raise_if_supported_modules_continue_to_be_su
             )
 
 
+def test_get_service_package_cached_rebuilds_on_config_change():
+    """Make sure the cached service package is reused until the config changes"""
+    svc_type = ServicePackageFactory.ServiceType.INFERENCE
+    with mock.patch.object(
+        ServicePackageFactory,
+        "get_service_package",
+        side_effect=lambda *_, **__: mock.MagicMock(),
+    ) as get_service_package_mock:
+        with mock.patch.object(ServicePackageFactory, "_SERVICE_PACKAGE_CACHE", {}):
+            with temp_config({}):
+                first = ServicePackageFactory.get_service_package_cached(svc_type)
+                assert ServicePackageFactory.get_service_package_cached(svc_type) is (
+                    first
+                )
+                assert get_service_package_mock.call_count == 1
+            with temp_config({}):
+                assert (
+                    ServicePackageFactory.get_service_package_cached(svc_type)
+                    is not first
+                )
+                assert get_service_package_mock.call_count == 2
+
+
 def test_override_domain(clean_data_model):
     """
     Test override of gRPC domain generation from config.
@@ -29,6 +29,7 @@ from caikit.runtime.utils.import_util import (
     clean_lib_names,
     get_data_model,
     get_dynamic_module,
+    get_library_version,
 )
 from tests.conftest import temp_config
 
@@ -176,3 +177,13 @@ def test_get_data_model_init_components_after_import():
                 # indicating that it's the call to initialize_components
                 assert not call_mock.call_args_list[-1].args
                 assert all(call.args for call in call_mock.call_args_list[:-1])
+
+
+def test_get_library_version():
+    """Make sure that the version of an installed library is found and that an
+    unknown library falls back to "unknown"
+    """
+    caikit_version = get_library_version("caikit")
+    assert caikit_version and caikit_version != "unknown"
+    assert get_library_version("caikit") is caikit_version
+    assert get_library_version("not-a-real-library") == "unknown"
@@ -296,6 +296,28 @@ def test_global_predict_build_caikit_library_request_dict_strips_empty_list_from
     assert "int_type" in request_dict.keys()
 
 
+def test_build_caikit_library_request_dict_reuses_field_presence_per_message(
+    sample_inference_service,
+):
+    """Repeated requests of the same message type with different fields set
+    each produce the correct kwargs
+    """
+    predict_class = DataBase.get_class_for_name("SampleTaskRequest")
+    signature = sample_lib.modules.sample_task.SamplePrimitiveModule.RUN_SIGNATURE
+
+    request_dict = build_caikit_library_request_dict(
+        predict_class(int_type=5, list_type=[]).to_proto(), signature
+    )
+    assert "list_type" not in request_dict.keys()
+    assert request_dict["int_type"] == 5
+
+    request_dict = build_caikit_library_request_dict(
+        predict_class(list_type=["a", "b"]).to_proto(), signature
+    )
+    assert list(request_dict["list_type"]) == ["a", "b"]
+    assert "int_type" not in request_dict.keys()
+
+
 def test_global_predict_build_caikit_library_request_dict_with_proto_does_not_include_unset_primitives(
     sample_inference_service,
 ):